@@ -6,6 +6,8 @@
 '''Sentinel-5P Downloader
 '''
 
+import datetime
+import dateutil.parser
 import hashlib
 import io
 import json
@@ -130,8 +132,37 @@ def __http_request(path, filename=None, headers=[], retries=9):
         return __http_request(path, filename, headers, retries-1)
 
 
+def __utc(timestamp):
+    '''Convert a timestamp to a timezone aware datetime in UTC.
+
+    :param timestamp: Datetime or ISO-8601 timestamp. Timestamps without
+                      timezone are assumed to be in UTC.
+    :returns: Datetime in UTC
+    :rtype: datetime.datetime
+    '''
+    if not isinstance(timestamp, datetime.datetime):
+        timestamp = dateutil.parser.parse(timestamp)
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.astimezone(datetime.timezone.utc)
+
+
+def __ingestion_date(product):
+    '''Get the ingestion date of a product from its index.
+
+    :param product: Product information as returned by the API
+    :returns: Ingestion date in UTC or None if not available
+    :rtype: datetime.datetime
+    '''
+    for index in product.get('indexes') or []:
+        for child in index.get('children') or []:
+            if child.get('name') == 'Ingestion Date' and child.get('value'):
+                return __utc(child['value'])
+    return None
+
+
 def _search(polygon, begin_ts, end_ts, product, processing_level,
-            processing_mode, offset, limit):
+            processing_mode, offset, limit, ingestion_ts=None):
     '''Make a single search request for products to the API.
 
     :param polygon: WKT polygon specifying an area the data should intersect
@@ -143,21 +174,27 @@ def _search(polygon, begin_ts, end_ts, product, processing_level,
                             ``Near real time`` or ``Reprocessing``)
     :param offset: Offset for the results to return
     :param limit: Limit number of results
+    :param ingestion_ts: ISO-8601 timestamp specifying the earliest ingestion
+                         date
     :returns: Dictionary containing information about found products
     '''
     filter_query = ['platformname:Sentinel-5']
     if polygon:
         filter_query.append(f'footprint:"Intersects({polygon})"')
     if begin_ts:
-        filter_query.append(f'beginPosition:[{begin_ts} TO {end_ts}]')
+        filter_query.append(
+            f'beginPosition:[{begin_ts} TO {end_ts or "*"}]')
     if end_ts:
-        filter_query.append(f'endPosition:[{begin_ts} TO {end_ts}]',)
+        filter_query.append(
+            f'endPosition:[{begin_ts or "*"} TO {end_ts}]')
     if product:
         filter_query.append(f'producttype:{product}')
     if processing_level:
         filter_query.append(f'processinglevel:{processing_level}')
     if processing_mode:
         filter_query.append(f'processingmode:{processing_mode}')
+    if ingestion_ts:
+        filter_query.append(f'ingestiondate:[{ingestion_ts} TO NOW]')
     filter_query = ' AND '.join(filter_query)
     query = {'filter': filter_query, 'offset': offset, 'limit': limit,
              'sortedby': 'ingestiondate', 'order': 'desc'}
@@ -169,7 +206,8 @@ def _search(polygon, begin_ts, end_ts, product, processing_level,
 
 
 def search(polygon=None, begin_ts=None, end_ts=None, product=None,
-           processing_level='L2', processing_mode=None, per_request_limit=25):
+           processing_level='L2', processing_mode=None, per_request_limit=25,
+           ingestion_ts=None):
     '''Search for products via API.
 
     :param polygon: WKT polygon specifying an area the data should intersect
@@ -180,6 +218,7 @@ def search(polygon=None, begin_ts=None, end_ts=None, product=None,
     :param processing_mode: Data processing mode (``Offline``,
                             ``Near real time`` or ``Reprocessing``)
     :param per_request_limit: Limit number of results per request
+    :param ingestion_ts: Datetime specifying the earliest ingestion date
     :returns: Dictionary containing information about found products
     '''
     try:
@@ -190,6 +229,10 @@ def search(polygon=None, begin_ts=None, end_ts=None, product=None,
         end_ts = end_ts.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
     except AttributeError:
         pass
+    try:
+        ingestion_ts = ingestion_ts.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    except AttributeError:
+        pass
 
     count = 0
     total = 1
@@ -197,7 +240,8 @@ def search(polygon=None, begin_ts=None, end_ts=None, product=None,
     logger.info('Searching for Sentinel-5 products')
     while count < total:
         s = _search(polygon, begin_ts, end_ts, product, processing_level,
-                    processing_mode, count, per_request_limit)
+                    processing_mode, count, per_request_limit,
+                    ingestion_ts)
         total = s.get('totalresults', 0)
         if data:
             data['products'].extend(s['products'])
@@ -210,6 +254,77 @@ def search(polygon=None, begin_ts=None, end_ts=None, product=None,
     return data
 
 
+def watch(polygon=None, begin_ts=None, end_ts=None, product=None,
+          processing_level='L2', processing_mode=None, per_request_limit=25,
+          ingestion_ts=None, margin=datetime.timedelta(minutes=10),
+          interval=60, retry=None):
+    '''Continuously poll the API for newly ingested products.
+
+    This generator remembers the ingestion date of the newest product it has
+    seen. Each poll only requests products ingested since then, minus a small
+    overlap window to catch products which became searchable late, and yields
+    those not seen before, oldest first. Failing polls are logged and retried
+    after the next interval.
+
+    Products which are not yielded again by the API, e.g. because their
+    download failed, can be appended to ``retry`` to have them yielded again
+    at the start of the next poll.
+
+    :param polygon: WKT polygon specifying an area the data should intersect
+    :param begin_ts: Datetime specifying the earliest sensing date
+    :param end_ts: Datetime specifying the latest sensing date
+    :param product: Type of product to request
+    :param processing_level: Data processing level (``L1B`` or ``L2``)
+    :param processing_mode: Data processing mode (``Offline``,
+                            ``Near real time`` or ``Reprocessing``)
+    :param per_request_limit: Limit number of results per request
+    :param ingestion_ts: Datetime specifying the earliest ingestion date to
+                         start watching from. Defaults to ``begin_ts`` if set
+                         or the current time otherwise.
+    :param margin: Timedelta by which each poll after the first one overlaps
+                   the previous one
+    :param interval: Number of seconds to wait between two polls
+    :param retry: Optional list of products to yield again on the next poll
+    :returns: Generator yielding information about new products
+    '''
+    mark = ingestion_ts or begin_ts
+    mark = __utc(mark) if mark else \
+        datetime.datetime.now(datetime.timezone.utc)
+
+    # uuids of products already yielded within the overlap window
+    seen = {}
+    since = mark
+    while True:
+        while retry:
+            yield retry.pop(0)
+
+        try:
+            result = search(polygon, begin_ts, end_ts, product,
+                            processing_level, processing_mode,
+                            per_request_limit,
+                            since.strftime('%Y-%m-%dT%H:%M:%S.%fZ'))
+        except (pycurl.error, ValueError, KeyError) as err:
+            logger.error('Failed to search for new products. %s', err)
+            result = {}
+
+        products = [(__ingestion_date(found), found)
+                    for found in result.get('products', [])]
+        products.sort(key=lambda p: p[0] or mark)
+        for date, found in products:
+            if found['uuid'] in seen or (date and date < since):
+                continue
+            seen[found['uuid']] = date or mark
+            mark = max(mark, date or mark)
+            yield found
+
+        # Forget products which dropped out of the overlap window
+        since = mark - margin
+        seen = {uuid: date for uuid, date in seen.items() if date >= since}
+
+        logger.debug('Waiting %s seconds for new products', interval)
+        time.sleep(interval)
+
+
 def download(products, output_dir='.'):
     '''Download a set of products via API.
 
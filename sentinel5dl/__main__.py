@@ -11,11 +11,13 @@ Sentinel-5p Downloader
 import argparse
 import dateutil.parser
 import certifi
+import functools
 import logging
 import multiprocessing
+import pycurl
 import textwrap
 import sentinel5dl
-from sentinel5dl import search, download
+from sentinel5dl import search, download, watch
 
 PRODUCTS = (
     'L1B_IR_SIR',
@@ -58,6 +60,9 @@ PROCESSING_MODES = (
     'Reprocessing'
 )
 
+DEFAULT_BEGIN_TS = dateutil.parser.parse('2019-09-01T00:00:00.000Z')
+DEFAULT_END_TS = dateutil.parser.parse('2019-09-17T23:59:59.999Z')
+
 
 def is_polygon(polygon):
     '''Validate if the supplied polygon string is in the necessary format to be
@@ -84,6 +89,36 @@ def is_polygon(polygon):
     return f'POLYGON(({polygon}))'
 
 
+def is_interval(interval):
+    '''Validate if the supplied polling interval is a positive number of
+    seconds.
+
+    :param interval: Number of seconds as string
+    :return: Number of seconds
+    '''
+    interval = int(interval)
+    if interval <= 0:
+        raise ValueError('Interval must be positive')
+    return interval
+
+
+def download_product(product, output_dir):
+    '''Download a single product, logging errors instead of raising them so
+    that one failed download does not end a long running watch.
+
+    :param product: Product information (e.g. yielded by watch)
+    :param output_dir: Directory to which the file will be downloaded.
+    :return: The product if the download failed, None otherwise
+    '''
+    try:
+        download((product,), output_dir)
+    except (pycurl.error, OSError) as err:
+        logger = logging.getLogger(sentinel5dl.__name__)
+        logger.error('Failed to download %s. Retrying on next poll. %s',
+                     product['uuid'], err)
+        return product
+
+
 def main():
     # Configure logging in the library
     logging.basicConfig()
@@ -127,20 +162,36 @@ def main():
 
     parser.add_argument(
         '--begin-ts',
-        default='2019-09-01T00:00:00.000Z',
         type=dateutil.parser.parse,
         help='''Timestamp specifying the earliest sensing date.
+            Defaults to 2019-09-01T00:00:00.000Z unless watching.
             Example: 2019-09-01T00:00:00.000Z'''
     )
 
     parser.add_argument(
         '--end-ts',
-        default='2019-09-17T23:59:59.999Z',
         type=dateutil.parser.parse,
         help='''Timestamp specifying the latest sensing date.
+            Defaults to 2019-09-17T23:59:59.999Z unless watching.
             Example: 2019-09-17T23:59:59.999Z'''
     )
 
+    parser.add_argument(
+        '--watch',
+        type=is_interval,
+        metavar='INTERVAL',
+        help='''Keep polling for newly ingested products every INTERVAL
+            seconds and download them as they appear'''
+    )
+
+    parser.add_argument(
+        '--ingestion-ts',
+        type=dateutil.parser.parse,
+        help='''Timestamp specifying the earliest ingestion date. When
+            watching, defaults to --begin-ts if set or the current time.
+            Example: 2019-09-01T00:00:00.000Z'''
+    )
+
     parser.add_argument(
         '--use-certifi',
         action='store_true',
@@ -168,14 +219,41 @@ def main():
     if args.use_certifi:
         sentinel5dl.ca_info = certifi.where()
 
+    if args.watch is not None:
+        failed = []
+        # Watch for new Sentinel-5 products without limiting the sensing date
+        # unless explicitly requested
+        products = watch(
+            polygon=args.polygon,
+            begin_ts=args.begin_ts,
+            end_ts=args.end_ts,
+            product=args.product,
+            processing_level=args.level,
+            processing_mode=args.mode,
+            ingestion_ts=args.ingestion_ts,
+            interval=args.watch,
+            retry=failed
+        )
+        # Download new products as they appear with number of workers and
+        # hand failed downloads back to be retried on the next poll
+        with multiprocessing.Pool(args.worker) as p:
+            for product in p.imap_unordered(
+                    functools.partial(download_product,
+                                      output_dir=args.download_dir),
+                    products):
+                if product:
+                    failed.append(product)
+        return
+
     # Search for Sentinel-5 products
     result = search(
         polygon=args.polygon,
-        begin_ts=args.begin_ts,
-        end_ts=args.end_ts,
+        begin_ts=args.begin_ts or DEFAULT_BEGIN_TS,
+        end_ts=args.end_ts or DEFAULT_END_TS,
         product=args.product,
         processing_level=args.level,
-        processing_mode=args.mode
+        processing_mode=args.mode,
+        ingestion_ts=args.ingestion_ts
     )
 
     # Download found products to the download directory with number of workers
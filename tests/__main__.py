@@ -1,10 +1,13 @@
 import datetime
+import itertools
+import json
 import os
 import pycurl
 import sentinel5dl
 import sentinel5dl.__main__ as executable
 import tempfile
 import unittest
+import unittest.mock
 import logging
 import sys
 
@@ -27,6 +30,14 @@ class TestSentinel5dl(unittest.TestCase):
         # search request
         if path.startswith('/api/stub/products?'):
             self._count_search_request += 1
+            self._search_paths.append(path)
+            if self._search_responses:
+                response = self._search_responses.pop(0)
+                if isinstance(response, Exception):
+                    raise response
+                if isinstance(response, bytes):
+                    return response
+                return json.dumps(response).encode('utf8')
             with open(os.path.join(testpath, 'products.json'), 'rb') as f:
                 return f.read()
 
@@ -48,6 +59,8 @@ class TestSentinel5dl(unittest.TestCase):
         self._count_search_request = 0
         self._count_checksum_request = 0
         self._count_download = 0
+        self._search_paths = []
+        self._search_responses = []
         logging.getLogger(sentinel5dl.__name__).setLevel(logging.WARNING)
 
     def test(self):
@@ -90,6 +103,77 @@ class TestSentinel5dl(unittest.TestCase):
         # We should have downloaded four unique files
         self.assertEqual(self._count_download, 4)
 
+    def _product(self, uuid, ingestion_date):
+        '''Create minimal product information as returned by the API.
+        '''
+        return {
+            'uuid': uuid,
+            'identifier': uuid,
+            'indexes': [{
+                'name': 'product',
+                'children': [{'name': 'Ingestion Date',
+                              'value': ingestion_date}]}]}
+
+    def _response(self, *products):
+        '''Create a search response containing the given products.
+        '''
+        return {'totalresults': len(products), 'products': list(products)}
+
+    def testWatch(self):
+        '''Test watching for new products.
+        '''
+        old = self._product('old', '2019-09-08T11:00:00.000Z')
+        early = self._product('early', '2019-09-08T11:55:00.000Z')
+        a = self._product('a', '2019-09-08T12:01:00.000Z')
+        b = self._product('b', '2019-09-08T12:02:00.000Z')
+        c = self._product('c', '2019-09-08T12:05:00.000Z')
+        late = self._product('late', '2019-09-08T12:01:30.000Z')
+        d = self._product('d', '2019-09-08T12:05:00.500Z')
+        self._search_responses = [
+            self._response(b, old, early, a),
+            self._response(b, c, late),
+            pycurl.error(7, 'Failed to connect'),
+            b'not json',
+            {},
+            self._response(c, d),
+        ]
+        retry = []
+        products = sentinel5dl.watch(
+            product='L2__CO____',
+            ingestion_ts=datetime.datetime(2019, 9, 8, 12),
+            interval=0,
+            retry=retry)
+
+        def poll(count):
+            return [p['uuid'] for p in itertools.islice(products, count)]
+
+        with unittest.mock.patch('time.sleep') as sleep:
+            # Products before the start are ignored, even within the overlap
+            # margin, and new ones come in order
+            self.assertEqual(poll(2), ['a', 'b'])
+            self.assertIn('ingestiondate:[2019-09-08T12:00:00.000000Z%20TO',
+                          self._search_paths[-1])
+
+            # Products at the mark are not yielded twice while products
+            # ingested before the mark but found late are not lost
+            self.assertEqual(poll(2), ['late', 'c'])
+            self.assertIn('ingestiondate:[2019-09-08T11:52:00.000000Z%20TO',
+                          self._search_paths[-1])
+
+            # Failing polls are logged and retried on the next interval
+            with self.assertLogs(sentinel5dl.logger, logging.ERROR) as logs:
+                self.assertEqual(poll(1), ['d'])
+            self.assertEqual(len(logs.records), 3)
+            self.assertEqual(self._count_search_request, 6)
+            self.assertIn('ingestiondate:[2019-09-08T11:55:00.000000Z%20TO',
+                          self._search_paths[-1])
+            self.assertEqual(sleep.call_count, 5)
+
+            # Products handed back for retry are yielded on the next poll
+            retry.append(a)
+            self.assertEqual(poll(1), ['a'])
+            self.assertEqual(retry, [])
+
     def testFailedRequest(self):
         sentinel5dl.API = 'http://127.0.0.1:9'
         request = getattr(sentinel5dl, '__original_http_request')
@@ -101,15 +185,21 @@ class TestSentinel5dl(unittest.TestCase):
 class TestExecutable(unittest.TestCase):
 
     def _mock_search(self, *args, **kwargs):
+        self._search_kwargs = kwargs
         return {'products': []}
 
     def _mock_download(self, products, _):
         self.assertEqual(products, [])
 
+    def _mock_watch(self, *args, **kwargs):
+        self._watch_kwargs = kwargs
+        return iter([])
+
     def setUp(self):
         # Mock library calls
         setattr(executable, 'search', self._mock_search)
         setattr(executable, 'download', self._mock_download)
+        setattr(executable, 'watch', self._mock_watch)
         logging.getLogger(sentinel5dl.__name__).setLevel(logging.WARNING)
         # override sys.argv. Otherwise argparse is trying to parse it.
         sys.argv = sys.argv[0:1] + ['.']
@@ -125,6 +215,44 @@ class TestExecutable(unittest.TestCase):
         sys.argv = [sys.argv[0], '--polygon', '3 1, 4 4, 2 4, 1 2, 3 1', '.']
         executable.main()
 
+    def testWatch(self):
+        '''Test the executable in watch mode.
+        '''
+        sys.argv = [sys.argv[0], '--watch', '30',
+                    '--ingestion-ts', '2019-09-08T12:00:00Z', '.']
+        executable.main()
+        self.assertEqual(self._watch_kwargs['interval'], 30)
+        self.assertEqual(self._watch_kwargs['ingestion_ts'].hour, 12)
+        self.assertIsNone(self._watch_kwargs['end_ts'])
+
+    def testInvalidInterval(self):
+        '''Test the executable with an invalid watch interval.
+        '''
+        for interval in ('0', '-1', 'a'):
+            sys.argv = [sys.argv[0], '--watch', interval, '.']
+            with self.assertRaises(SystemExit) as e:
+                executable.main()
+            self.assertNotEqual(e.exception.code, 0)
+
+    def testDownloadProductError(self):
+        '''Test that a failed download is logged instead of raised.
+        '''
+        def failing_download(products, output_dir):
+            raise pycurl.error(28, 'Operation timed out')
+
+        setattr(executable, 'download', failing_download)
+        with self.assertLogs(sentinel5dl.logger, logging.ERROR):
+            product = executable.download_product({'uuid': 'a'}, '.')
+        self.assertEqual(product, {'uuid': 'a'})
+
+    def testIngestionTs(self):
+        '''Test searching by ingestion date without watching.
+        '''
+        sys.argv = [sys.argv[0], '--ingestion-ts', '2019-09-08T12:00:00Z',
+                    '.']
+        executable.main()
+        self.assertEqual(self._search_kwargs['ingestion_ts'].hour, 12)
+
     def testInvalidPolygons(self):
         '''Tests with invalid polygons.
         '''